@@ -2,62 +2,68 @@
 Tests for the Mergington High School Activities API
 """
 
+import asyncio
+import copy
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
+import pytest_asyncio
+from fastapi.responses import RedirectResponse
 
-# Add src directory to path to import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from src.app import app, activities
 
-from app import app, activities
 
-# Create test client
-client = TestClient(app)
+# Snapshot of the initial activities, taken before any test mutates them
+_ORIGINAL_STATE = copy.deepcopy(activities)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create a single async client shared by the whole session"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+def _restore_activities():
+    """Restore activities to the initial snapshot"""
+    # Only the participant lists are mutated, so only they need fresh copies
+    activities.clear()
+    activities.update({
+        name: {**details, "participants": details["participants"].copy()}
+        for name, details in _ORIGINAL_STATE.items()
+    })
+
+
+@pytest.fixture(scope="session", autouse=True)
+def restore_activities_at_exit():
+    """Leave activities pristine once the whole session is done"""
+    yield
+    _restore_activities()
 
 
 @pytest.fixture
 def reset_activities():
     """Reset activities to initial state before each test"""
-    # Store original state
-    original_state = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Clear and reset activities
-    activities.clear()
-    activities.update(original_state)
-    
-    yield
-    
-    # Reset after test
-    activities.clear()
-    activities.update(original_state)
+    # The next test resets on entry, so there is no per-test teardown
+    _restore_activities()
 
 
 class TestRootEndpoint:
     """Test the root endpoint"""
     
-    def test_root_redirect(self):
+    def test_root_route_redirects(self):
+        """Test the root route's redirect without an HTTP roundtrip"""
+        route = next(r for r in app.router.routes if r.path == "/")
+        response = route.endpoint()
+        
+        assert isinstance(response, RedirectResponse)
+        assert response.status_code == 307
+        assert response.headers["location"] == "/static/index.html"
+    
+    @pytest.mark.contract
+    async def test_root_redirect(self, client):
         """Test that root redirects to static/index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = await client.get("/", follow_redirects=False)
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -65,9 +71,10 @@ class TestRootEndpoint:
 class TestActivitiesEndpoint:
     """Test the activities endpoint"""
     
-    def test_get_activities(self, reset_activities):
+    @pytest.mark.contract
+    async def test_get_activities(self, client, reset_activities):
         """Test getting all activities"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
         
         data = response.json()
@@ -81,21 +88,20 @@ class TestActivitiesEndpoint:
         assert data["Chess Club"]["max_participants"]
         assert data["Chess Club"]["participants"]
     
-    def test_get_activities_has_participants(self, reset_activities):
-        """Test that activities have correct initial participants"""
-        response = client.get("/activities")
-        data = response.json()
+    def test_initial_activities_have_participants(self, reset_activities):
+        """Test that the seeded activities start with their participants"""
+        participants = activities["Chess Club"]["participants"]
         
-        assert "michael@mergington.edu" in data["Chess Club"]["participants"]
-        assert "daniel@mergington.edu" in data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" in participants
+        assert "daniel@mergington.edu" in participants
 
 
 class TestSignupEndpoint:
     """Test the signup endpoint"""
     
-    def test_signup_success(self, reset_activities):
+    async def test_signup_success(self, client, reset_activities):
         """Test successful signup"""
-        response = client.post(
+        response = await client.post(
             "/activities/Chess Club/signup?email=newstudent@mergington.edu"
         )
         assert response.status_code == 200
@@ -104,37 +110,15 @@ class TestSignupEndpoint:
         assert "message" in data
         assert "newstudent@mergington.edu" in data["message"]
     
-    def test_signup_adds_participant(self, reset_activities):
+    async def test_signup_adds_participant(self, client, reset_activities):
         """Test that signup actually adds the participant"""
-        client.post("/activities/Chess Club/signup?email=newstudent@mergington.edu")
-        
-        response = client.get("/activities")
-        data = response.json()
+        await client.post("/activities/Chess Club/signup?email=newstudent@mergington.edu")
         
-        assert "newstudent@mergington.edu" in data["Chess Club"]["participants"]
-        assert len(data["Chess Club"]["participants"]) == 3
+        participants = activities["Chess Club"]["participants"]
+        assert "newstudent@mergington.edu" in participants
+        assert len(participants) == 3
     
-    def test_signup_invalid_activity(self, reset_activities):
-        """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/NonExistent Club/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-    
-    def test_signup_duplicate_student(self, reset_activities):
-        """Test signup when student already registered"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=michael@mergington.edu"
-        )
-        assert response.status_code == 400
-        
-        data = response.json()
-        assert "already signed up" in data["detail"]
-    
-    def test_signup_multiple_students(self, reset_activities):
+    async def test_signup_multiple_students(self, client, reset_activities):
         """Test multiple students can sign up"""
         emails = [
             "student1@mergington.edu",
@@ -142,25 +126,23 @@ class TestSignupEndpoint:
             "student3@mergington.edu"
         ]
         
-        for email in emails:
-            response = client.post(
-                f"/activities/Programming Class/signup?email={email}"
-            )
-            assert response.status_code == 200
-        
-        response = client.get("/activities")
-        data = response.json()
+        responses = await asyncio.gather(*(
+            client.post("/activities/Programming Class/signup", params={"email": email})
+            for email in emails
+        ))
+        assert all(response.status_code == 200 for response in responses)
         
+        participants = activities["Programming Class"]["participants"]
         for email in emails:
-            assert email in data["Programming Class"]["participants"]
+            assert email in participants
 
 
 class TestUnregisterEndpoint:
     """Test the unregister endpoint"""
     
-    def test_unregister_success(self, reset_activities):
+    async def test_unregister_success(self, client, reset_activities):
         """Test successful unregistration"""
-        response = client.delete(
+        response = await client.delete(
             "/activities/Chess Club/signup/michael@mergington.edu"
         )
         assert response.status_code == 200
@@ -168,70 +150,74 @@ class TestUnregisterEndpoint:
         data = response.json()
         assert "Unregistered" in data["message"]
     
-    def test_unregister_removes_participant(self, reset_activities):
+    async def test_unregister_removes_participant(self, client, reset_activities):
         """Test that unregister actually removes the participant"""
-        client.delete("/activities/Chess Club/signup/michael@mergington.edu")
-        
-        response = client.get("/activities")
-        data = response.json()
-        
-        assert "michael@mergington.edu" not in data["Chess Club"]["participants"]
-        assert len(data["Chess Club"]["participants"]) == 1
-    
-    def test_unregister_invalid_activity(self, reset_activities):
-        """Test unregister from non-existent activity"""
-        response = client.delete(
-            "/activities/NonExistent Club/signup/student@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "Activity not found" in data["detail"]
-    
-    def test_unregister_not_registered_student(self, reset_activities):
-        """Test unregister when student not registered"""
-        response = client.delete(
-            "/activities/Chess Club/signup/notstudent@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "not registered" in data["detail"]
+        await client.delete("/activities/Chess Club/signup/michael@mergington.edu")
+        
+        participants = activities["Chess Club"]["participants"]
+        assert "michael@mergington.edu" not in participants
+        assert len(participants) == 1
+
+
+class TestErrorResponses:
+    """Test error responses from the signup and unregister endpoints"""
+    
+    @pytest.mark.parametrize(
+        "method,path,status,detail",
+        [
+            ("POST", "/activities/NonExistent Club/signup?email=student@mergington.edu",
+             404, "Activity not found"),
+            ("POST", "/activities/Chess Club/signup?email=michael@mergington.edu",
+             400, "already signed up"),
+            ("DELETE", "/activities/NonExistent Club/signup/student@mergington.edu",
+             404, "Activity not found"),
+            ("DELETE", "/activities/Chess Club/signup/notstudent@mergington.edu",
+             404, "not registered"),
+        ],
+        ids=[
+            "signup_invalid_activity",
+            "signup_duplicate_student",
+            "unregister_invalid_activity",
+            "unregister_not_registered_student",
+        ],
+    )
+    async def test_error_response(self, client, reset_activities, method, path, status, detail):
+        """Test that invalid requests return the expected status and detail"""
+        response = await client.request(method, path)
+        assert response.status_code == status
+        assert detail in response.json()["detail"]
 
 
 class TestIntegration:
     """Integration tests for signup and unregister workflow"""
     
-    def test_signup_and_unregister_flow(self, reset_activities):
+    async def test_signup_and_unregister_flow(self, client, reset_activities):
         """Test complete flow: signup then unregister"""
         email = "testuser@mergington.edu"
         activity = "Programming Class"
         
         # Verify not registered
-        response = client.get("/activities")
-        assert email not in response.json()[activity]["participants"]
+        assert email not in activities[activity]["participants"]
         
         # Sign up
-        response = client.post(
-            f"/activities/{activity}/signup?email={email}"
+        response = await client.post(
+            f"/activities/{activity}/signup", params={"email": email}
         )
         assert response.status_code == 200
         
         # Verify registered
-        response = client.get("/activities")
-        assert email in response.json()[activity]["participants"]
+        assert email in activities[activity]["participants"]
         
         # Unregister
-        response = client.delete(
+        response = await client.delete(
             f"/activities/{activity}/signup/{email}"
         )
         assert response.status_code == 200
         
         # Verify unregistered
-        response = client.get("/activities")
-        assert email not in response.json()[activity]["participants"]
+        assert email not in activities[activity]["participants"]
     
-    def test_full_activity_lifecycle(self, reset_activities):
+    async def test_full_activity_lifecycle(self, client, reset_activities):
         """Test complete activity lifecycle with multiple users"""
         activity = "Gym Class"
         initial_count = len(activities[activity]["participants"])
@@ -239,26 +225,23 @@ class TestIntegration:
         users = [f"user{i}@mergington.edu" for i in range(3)]
         
         # Sign up multiple users
-        for user in users:
-            response = client.post(
-                f"/activities/{activity}/signup?email={user}"
-            )
-            assert response.status_code == 200
+        responses = await asyncio.gather(*(
+            client.post(f"/activities/{activity}/signup", params={"email": user})
+            for user in users
+        ))
+        assert all(response.status_code == 200 for response in responses)
         
         # Verify all signed up
-        response = client.get("/activities")
-        data = response.json()
-        assert len(data[activity]["participants"]) == initial_count + 3
+        assert len(activities[activity]["participants"]) == initial_count + 3
         
         # Unregister one user
-        response = client.delete(
+        response = await client.delete(
             f"/activities/{activity}/signup/{users[0]}"
         )
         assert response.status_code == 200
         
         # Verify correct count
-        response = client.get("/activities")
-        data = response.json()
-        assert len(data[activity]["participants"]) == initial_count + 2
-        assert users[0] not in data[activity]["participants"]
-        assert users[1] in data[activity]["participants"]
+        participants = activities[activity]["participants"]
+        assert len(participants) == initial_count + 2
+        assert users[0] not in participants
+        assert users[1] in participants